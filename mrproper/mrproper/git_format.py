@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 
+import hashlib
+import json
+import os
 import subprocess
 import sys
 import tempfile
@@ -27,35 +30,198 @@ this comment manually. Also mention it on
 """
 
 
-def handle_mr(proj, mriid):
-    mr = gitlab.gitlab("/projects/{}/merge_requests/{}"
-                       .format(proj, mriid))
+_FORMAT_CACHE = os.path.join(os.path.expanduser("~"),
+                             ".cache", "mr-validator", "format-ok.json")
+
+
+def _load_format_cache():
+    try:
+        with open(_FORMAT_CACHE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_format_cache(cache):
+    try:
+        os.makedirs(os.path.dirname(_FORMAT_CACHE), exist_ok=True)
+        with open(_FORMAT_CACHE, "w") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+
+def _tree_keys(tdir, mrcommits):
+    """Digest the (blob, path) entries each commit touches.
+
+    Formatting is a pure function of these entries, so the digest can be
+    used as a verdict cache key that survives rebases which leave the
+    touched content itself untouched. One `git diff-tree --stdin` batch
+    covers all commits.
+    """
+    # The input must end with a newline: diff-tree drops an
+    # unterminated final line, which would leave the oldest commit
+    # without a key and keep the fast path from ever firing
+    out = subprocess.run(["git", "diff-tree", "-r", "--stdin"],
+                         input="\n".join(c.id for c in mrcommits) + "\n",
+                         capture_output=True, text=True, check=True,
+                         cwd=tdir).stdout
+
+    def digest(entries):
+        return hashlib.blake2b("\n".join(sorted(entries)).encode("utf-8"),
+                               digest_size=16).hexdigest()
+
+    keys = {}
+    current = None
+    entries = []
+    for line in out.splitlines():
+        if line.startswith(":"):
+            meta, path = line.split("\t", 1)
+            entries.append(meta.split()[3] + ":" + path)
+        elif line:
+            if current and entries:
+                keys[current] = digest(entries)
+            current = line.split()[0]
+            entries = []
+    if current and entries:
+        keys[current] = digest(entries)
+    # Merge commits emit no entries (diff-tree without -m) and are left
+    # out entirely: giving them all the same empty digest would alias
+    # their verdicts onto one cache slot
+    return keys
+
+
+def _per_commit_checks(tdir, mrcommits, keys, cache, errors):
+    """Check each commit in isolation with a reset+format+rev-parse
+    triple per commit. Slower than the rebase pass, but it has no
+    parent-revision or conflict dependencies, so it works on any MR."""
+    for commit in mrcommits:
+        subprocess.check_call(["git", "reset", "-q", "--hard",
+                               commit.id], cwd=tdir)
+        subprocess.check_call(["git", "format", "--fixup"],
+                              cwd=tdir)
+        sha = subprocess.check_output(
+            ["git", "rev-parse", "HEAD"],
+            cwd=tdir).strip().decode("utf-8")
+        ok = sha == commit.id
+        if commit.id in keys:
+            cache[keys[commit.id]] = ok
+        if not ok:
+            errors.append("* Commit {} `{}` contains formatting errors. Use 'git format'"
+                          .format(commit.id[:9], commit.title))
+
 
+def handle_mr(proj, mriid):
+    # The MR object itself is not needed: its iid is the mriid argument
+    assert isinstance(mriid, int)
     mrcommits = gitlab.gitlab("/projects/{}/merge_requests/{}/commits"
-                              .format(proj, mr.iid))
+                              .format(proj, mriid))
 
     errors = []
     with tempfile.TemporaryDirectory() as tdir:
-        subprocess.call(["git", "init", "-q"], cwd=tdir)
-        subprocess.call(["git", "fetch", "-q",
-                         "--depth={}".format(max(len(mrcommits), 100)),
-                         gitlab.get_clone_url(sys.argv[1]),
-                         "merge-requests/{}/head".format(mr.iid)],
-                        cwd=tdir)
-
-        subprocess.check_output(["git", "checkout", "-q", "-b", "check", "FETCH_HEAD"], cwd=tdir)
-
-        for commit in mrcommits:
-            print("Checking out %s" % commit)
-            subprocess.check_call(["git", "reset", "-q", "--hard", commit.id], cwd=tdir)
-            subprocess.check_call(["git", "format", "--fixup"], cwd=tdir)
-            sha = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=tdir)
-            sha = sha.strip().decode("utf-8")
-            if sha != commit.id:
-                errors.append("* Commit {} `{}` contains formatting errors. Use 'git format'"
-                              .format(commit.id[:9], commit.title))
-                # subprocess.check_call(["git", "show", sha], cwd=tdir)
-
+        # Partial clone: skip blob content up front and let git fault in
+        # only the blobs `git format` actually touches. Servers without
+        # uploadpack.allowFilter ignore the filter and fall back to the
+        # plain shallow fetch.
+        subprocess.check_call(["git", "clone", "-q", "--no-checkout",
+                               "--filter=blob:none",
+                               "--depth={}".format(max(len(mrcommits), 100)),
+                               gitlab.get_clone_url(sys.argv[1]), tdir])
+        subprocess.check_call(["git", "fetch", "-q", "origin",
+                               "merge-requests/{}/head:check".format(mriid)],
+                              cwd=tdir)
+
+        # Commits whose touched (blob, path) entries were verdicted in a
+        # previous run (e.g. a re-push after rebasing on target) need no
+        # re-check at all
+        keys = _tree_keys(tdir, mrcommits)
+        cache = _load_format_cache()
+        if all(keys.get(c.id) in cache for c in mrcommits):
+            print("All %d commits known from previous runs" % len(mrcommits))
+            for commit in mrcommits:
+                if not cache[keys[commit.id]]:
+                    errors.append("* Commit {} `{}` contains formatting errors. Use 'git format'"
+                                  .format(commit.id[:9], commit.title))
+            return report_errors(proj, mriid, errors)
+
+        # The sparse checkout and the rebase pass both diff against the
+        # oldest commit's parent; an MR containing the repo's root
+        # commit has none, so those shortcuts are skipped outright
+        base = "{}^".format(mrcommits[-1].id)
+        have_base = subprocess.call(
+            ["git", "rev-parse", "-q", "--verify", base],
+            cwd=tdir, stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL) == 0
+
+        # Materialize only the paths the MR touches; combined with the
+        # blob-less clone this keeps checkout I/O proportional to the
+        # change instead of the repo size
+        if have_base:
+            changed = subprocess.check_output(
+                ["git", "diff", "--name-only", base, "check"],
+                cwd=tdir).decode("utf-8").splitlines()
+            if changed:
+                subprocess.check_call(["git", "sparse-checkout", "set",
+                                       "--no-cone", "--"] + changed,
+                                      cwd=tdir)
+
+        subprocess.check_output(["git", "switch", "-q", "check"], cwd=tdir)
+
+        # Drive `git format --fixup` over all commits in one `git rebase`
+        # pass instead of a reset+format+rev-parse subprocess triple per
+        # commit. The exec snippet records HEAD before and after the fixup,
+        # so a changed SHA means the commit had formatting errors. During
+        # an exec rebase HEAD is detached, so .git/HEAD holds the raw SHA
+        # and a plain read replaces the `git rev-parse` spawns.
+        print("Checking %d commits" % len(mrcommits))
+        shas = None
+        if have_base:
+            try:
+                subprocess.check_call(
+                    ["git", "rebase", "-q", "--exec",
+                     "cat .git/HEAD >> .fmt-shas"
+                     " && git format --fixup"
+                     " && cat .git/HEAD >> .fmt-shas",
+                     base],
+                    cwd=tdir)
+            except subprocess.CalledProcessError:
+                # A fixup amending one commit can conflict with a later
+                # commit touching the same lines; the rebase then stops
+                # mid-way on the conflict
+                print("Rebase stopped - falling back to per-commit checks")
+                subprocess.call(["git", "rebase", "--abort"], cwd=tdir,
+                                stderr=subprocess.DEVNULL)
+            else:
+                with open(os.path.join(tdir, ".fmt-shas")) as f:
+                    shas = f.read().split()
+                if len(shas) != 2 * len(mrcommits):
+                    # The rebase silently skips merge commits, so the
+                    # before/after pairs cannot be attributed to commits
+                    # safely
+                    print("Rebase covered %d of %d commits - "
+                          "falling back to per-commit checks"
+                          % (len(shas) // 2, len(mrcommits)))
+                    shas = None
+
+        if shas is None:
+            _per_commit_checks(tdir, mrcommits, keys, cache, errors)
+        else:
+            # GitLab lists commits newest first, the rebase applies them
+            # oldest first.
+            for commit, before, after in zip(reversed(mrcommits),
+                                             shas[0::2], shas[1::2]):
+                ok = before == after
+                if commit.id in keys:
+                    cache[keys[commit.id]] = ok
+                if not ok:
+                    errors.append("* Commit {} `{}` contains formatting errors. Use 'git format'"
+                                  .format(commit.id[:9], commit.title))
+        _save_format_cache(cache)
+
+    report_errors(proj, mriid, errors)
+
+
+def report_errors(proj, mriid, errors):
     if errors:
         must_not_be_resolved = True
         errors.append(INSTRUCTIONS_ON_ERRORS)
@@ -5,8 +5,8 @@ import os
 import re
 import subprocess
 import sys
-import tempfile
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 
 from . import gitlab
 
@@ -16,17 +16,42 @@ HEADER = """\
 
 """
 
+# Compiled once at import; these run against every commit of every MR
+_SUBJECT_RE = re.compile(r'([A-Z]*)(?:\(([-A-Z0-9, #]+)\))?:(.*)')
+_BRACKET_RE = re.compile(r' (\[[^\]]*\])(.*)')
+_LEADING_NONCAP_RE = re.compile(r' [^A-Z]')
 
-def get_config(checkoutdir):
-    confpath = os.path.join(checkoutdir, ".mr-proper.conf")
+_RBY = "Reviewed-By: "
+_RBY_LEN = len(_RBY)
+
+
+class _EmptyConf:
+    # Stands in for a ConfigParser when the repo has no config file
+    # (the common case), so no parser has to be built at all
+    @staticmethod
+    def get(section, key, fallback=None):
+        return fallback
+
+
+_EMPTY_CONF = _EmptyConf()
+
+
+def get_config(tdir):
+    # Read the config blob straight from the fetched ref; no working
+    # tree is checked out
+    try:
+        data = subprocess.check_output(
+            ["git", "show", "FETCH_HEAD:.mr-proper.conf"],
+            cwd=tdir, stderr=subprocess.DEVNULL).decode("utf-8")
+    except subprocess.CalledProcessError:
+        return _EMPTY_CONF
     conf = configparser.ConfigParser()
-    if os.path.exists(confpath):
-        conf.read(confpath)
+    conf.read_string(data)
     return conf
 
 
 def parse_tag_and_ticket_from_subject(subject):
-    m = re.match(r'([A-Z]*)(?:\(([-A-Z0-9, #]+)\))?:(.*)', subject)
+    m = _SUBJECT_RE.match(subject)
     if not m:
         return None, None, subject
     return m.group(1), m.group(2), m.group(3)
@@ -37,125 +62,195 @@ def looks_like_a_real_name(name):
 
 
 def handle_mr(proj, mriid):
-    thumbs_in_gitlab = gitlab.get_award_users(proj, mriid)
-
-    mr = gitlab.gitlab("/projects/{}/merge_requests/{}"
-                       .format(proj, mriid))
-
-    mrcommits = gitlab.gitlab("/projects/{}/merge_requests/{}/commits"
-                              .format(proj, mr.iid))
+    # The three reads are independent (the MR's iid is the mriid
+    # argument), so overlap them instead of paying three round-trips
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        thumbs_f = ex.submit(gitlab.get_award_users, proj, mriid)
+        mr_f = ex.submit(gitlab.gitlab,
+                         "/projects/{}/merge_requests/{}".format(proj, mriid))
+        commits_f = ex.submit(gitlab.gitlab,
+                              "/projects/{}/merge_requests/{}/commits"
+                              .format(proj, mriid))
+        thumbs_in_gitlab = thumbs_f.result()
+        mr = mr_f.result()
+        mrcommits = commits_f.result()
 
     errors = []
-    with tempfile.TemporaryDirectory() as tdir:
-        subprocess.call(["git", "init", "-q"], cwd=tdir)
-        subprocess.call(["git", "fetch", "-q",
-                         "--depth={}".format(max(len(mrcommits), 100)),
-                         gitlab.get_clone_url(sys.argv[1]),
-                         "merge-requests/{}/head".format(mr.iid)],
-                        cwd=tdir)
-
-        subprocess.check_output(["git", "checkout", "-q", "-b", "check", "FETCH_HEAD"], cwd=tdir)
-
-        config = get_config(tdir)
-
-        valid_tags = set(config.get("message", "valid_tags",
-                                    fallback="BUG,FEATURE,IMPROVEMENT,REFACTOR").split(","))
-        valid_tags_without_ticket = set(config.get("message", "valid_tags_without_ticket",
-                                                   fallback="IMPROVEMENT,REFACTOR").split(","))
-
-        commits_with_no_reviewedby = 0
-        for commit in mrcommits:
-            commiterrors = []
-            d = subprocess.check_output(["git", "cat-file", "commit", commit.id], cwd=tdir)
-            d = d.decode("utf-8")
-            hdrs, body = d.split("\n\n", 1)
-            body = body
-
-            lines = body.split("\n")
-
-            subject = lines[0]
-
-            reg = re.compile(r'^(author|committer) (?P<name>.+) <(?P<email>.+)> .*$', re.MULTILINE)
-            for match in reg.findall(hdrs):
-                what, name, _email = match
-                if not looks_like_a_real_name(name):
-                    commiterrors.append(f'{what} "{name}" does not look like a real name')
-
-            tag, tickets, rest = parse_tag_and_ticket_from_subject(subject)
-            if tag is None:
-                commiterrors.append("Commit subject not properly tagged")
+    # Long-lived bare repo per project: the second MR on the same repo
+    # reuses the objects already fetched and only downloads new packs
+    tdir = os.path.join(os.path.expanduser("~"), ".cache", "mr-validator",
+                        "repos", proj + ".git")
+    if not os.path.isdir(tdir):
+        os.makedirs(tdir, exist_ok=True)
+        subprocess.call(["git", "init", "-q", "--bare"], cwd=tdir)
+    # Fetch through a configured credential-free remote with the token
+    # supplied per invocation: fetching the token-bearing URL directly
+    # would make git persist it as a promisor remote in the cache
+    # repo's config, writing the secret to disk for the cache's
+    # lifetime and pinning a token that rotates
+    clone_url = gitlab.get_public_clone_url(sys.argv[1])
+    if subprocess.call(["git", "remote", "set-url", "origin", clone_url],
+                       cwd=tdir, stderr=subprocess.DEVNULL) != 0:
+        subprocess.check_call(["git", "remote", "add", "origin", clone_url],
+                              cwd=tdir)
+    auth = gitlab.get_http_auth_config()
+    # Blob-less fetch and no checkout: the message checks only read
+    # commit objects, so no file content ever needs to hit the disk.
+    # The depth covers the MR's commits (floored at 1: --depth=0 is a
+    # fatal fetch error on empty MRs). A failed fetch raises here
+    # instead of surfacing as a confusing git log error later.
+    mr_ref = "merge-requests/{}/head".format(mr.iid)
+    subprocess.check_call(["git", "-c", auth, "fetch", "-q",
+                           "--filter=blob:none",
+                           "--depth={}".format(max(len(mrcommits), 1)),
+                           "origin", mr_ref],
+                          cwd=tdir)
+
+    config = get_config(tdir)
+
+    valid_tags = set(config.get("message", "valid_tags",
+                                fallback="BUG,FEATURE,IMPROVEMENT,REFACTOR").split(","))
+    valid_tags_without_ticket = set(config.get("message", "valid_tags_without_ticket",
+                                               fallback="IMPROVEMENT,REFACTOR").split(","))
+
+    # One `git log` batch streams identities and messages for every
+    # commit, instead of a `git cat-file` subprocess per commit
+    def read_commitdata():
+        out = subprocess.check_output(
+            ["git", "log", "-z",
+             "--format=%H%x1f%an%x1f%cn%x1f%B", "FETCH_HEAD"],
+            cwd=tdir)
+        commitdata = {}
+        # Split in bytes and decode per field, so a stray non-UTF-8 byte
+        # in one message body cannot take down the whole batch
+        for record in out.split(b"\0"):
+            if record:
+                sha, author, committer, body = record.split(b"\x1f", 3)
+                commitdata[sha.decode("ascii")] = (
+                    author.decode("utf-8", errors="replace"),
+                    committer.decode("utf-8", errors="replace"),
+                    body.decode("utf-8", errors="replace"))
+        return commitdata
+
+    commitdata = read_commitdata()
+    if any(c.id not in commitdata for c in mrcommits):
+        # The shallow fetch came back short (merge-heavy MR, or a
+        # concurrent run on the shared bare repo moved FETCH_HEAD
+        # under us); refetch without a depth limit and re-read
+        subprocess.check_call(["git", "-c", auth, "fetch", "-q",
+                               "--filter=blob:none", "origin", mr_ref],
+                              cwd=tdir)
+        commitdata = read_commitdata()
+
+    commits_with_no_reviewedby = 0
+    # Stacked MRs tend to share the same reviewer set, so the sorted
+    # missing-thumbs message is formatted once per distinct set
+    missing_msgs = {}
+    for commit in mrcommits:
+        commiterrors = []
+        commitfields = commitdata.get(commit.id)
+        if commitfields is None:
+            # Even the refetch can lose the race against a concurrent
+            # run moving FETCH_HEAD on the shared bare repo; report it
+            # on the commit instead of dying with a traceback
+            errors.append((commit, ["commit not found in fetched history "
+                                    "(concurrent fetch?) - re-run the check"]))
+            continue
+        author, committer, body = commitfields
+
+        lines = body.split("\n")
+
+        subject = lines[0]
+
+        for what, name in (("author", author), ("committer", committer)):
+            if not looks_like_a_real_name(name):
+                commiterrors.append(f'{what} "{name}" does not look like a real name')
+
+        tag, tickets, rest = parse_tag_and_ticket_from_subject(subject)
+        if tag is None:
+            commiterrors.append("Commit subject not properly tagged")
+        else:
+            if tag not in valid_tags:
+                commiterrors.append("Commit subject tag '%s' is not valid" % tag)
+            if tickets is None and tag not in valid_tags_without_ticket:
+                commiterrors.append("Commit subject tag '%s' need a bug ticket" % tag)
+            if rest[0] != ' ':
+                commiterrors.append("Commit subject should have space after 'TAG: '")
             else:
-                if tag not in valid_tags:
-                    commiterrors.append("Commit subject tag '%s' is not valid" % tag)
-                if tickets is None and tag not in valid_tags_without_ticket:
-                    commiterrors.append("Commit subject tag '%s' need a bug ticket" % tag)
-                if rest[0] != ' ':
-                    commiterrors.append("Commit subject should have space after 'TAG: '")
-                else:
-                    m = re.match(r' (\[[^\]]*\])(.*)', rest)
-                    if m:
-                        rest = m.group(2)
-
-                m = re.match(r' [^A-Z]', rest)
+                m = _BRACKET_RE.match(rest)
                 if m:
-                    commiterrors.append("Commit subject should "
-                                        "start with capital letter")
+                    rest = m.group(2)
 
-            if subject.strip()[-1] == '.':
+            m = _LEADING_NONCAP_RE.match(rest)
+            if m:
                 commiterrors.append("Commit subject should "
-                                    "NOT end with period (.)")
-
-            if subject.strip() != subject:
-                commiterrors.append("Commit subject has extra whitespace")
-
-            if len(subject) > 76:
-                commiterrors.append("Commit subject should be at most "
-                                    "76 columns wide")
-
-            reviewers = set()
-            if len(lines) > 1:
-                if lines[1] != "":
-                    commiterrors.append("Commit should "
-                                        "have an empty line between subject and body")
-
-                for l in lines[2:]:
-                    if len(l) > 72 and l[:2] != "  ":
-                        commiterrors.append("Commit message body should "
-                                            "be wrapped at 72 columns")
-                        break
-
-                for l in lines:
-                    if l.strip() == "Reviewed-By:":
-                        commiterrors.append("Commit should not contain empty 'Reviewed-By' trailer")
-                    elif l.startswith("Reviewed-By: "):
-                        reviewer = l[len("Reviewed-By: "):]
-
-                        # falsehoods programmers believe about names
-                        if not looks_like_a_real_name(reviewer):
-                            commiterrors.append("'{}' doesn't look like a real reviewer"
-                                                .format(reviewer))
-                        elif reviewer in reviewers:
-                            commiterrors.append("'{}' was mentioned twice in Reviewed-By"
-                                                .format(reviewer))
-                        else:
-                            reviewers.add(reviewer)
-
-            if not reviewers:
-                commits_with_no_reviewedby += 1
-
+                                    "start with capital letter")
+
+        if subject.strip()[-1] == '.':
+            commiterrors.append("Commit subject should "
+                                "NOT end with period (.)")
+
+        if subject.strip() != subject:
+            commiterrors.append("Commit subject has extra whitespace")
+
+        if len(subject) > 76:
+            commiterrors.append("Commit subject should be at most "
+                                "76 columns wide")
+
+        reviewers = set()
+        if len(lines) > 1:
+            if lines[1] != "":
+                commiterrors.append("Commit should "
+                                    "have an empty line between subject and body")
+
+            # One pass over the body handles both the wrap check and
+            # the Reviewed-By trailers
+            wrap_reported = False
+            for i, l in enumerate(lines):
+                if (i >= 2 and not wrap_reported
+                        and len(l) > 72 and l[:2] != "  "):
+                    commiterrors.append("Commit message body should "
+                                        "be wrapped at 72 columns")
+                    wrap_reported = True
+
+                if l.strip() == "Reviewed-By:":
+                    commiterrors.append("Commit should not contain empty 'Reviewed-By' trailer")
+                elif l.startswith(_RBY):
+                    reviewer = l[_RBY_LEN:]
+
+                    # falsehoods programmers believe about names
+                    if not looks_like_a_real_name(reviewer):
+                        commiterrors.append("'{}' doesn't look like a real reviewer"
+                                            .format(reviewer))
+                    elif reviewer in reviewers:
+                        commiterrors.append("'{}' was mentioned twice in Reviewed-By"
+                                            .format(reviewer))
+                    else:
+                        reviewers.add(reviewer)
+
+        if not reviewers:
+            commits_with_no_reviewedby += 1
+
+        if os.environ.get("MRPROPER_DEBUG"):
             print(reviewers)
             print(thumbs_in_gitlab)
-            missing_thumbs = set(reviewers) - thumbs_in_gitlab
-            if missing_thumbs:
-                commiterrors.append("The following persons were mentioned "
-                                    "in 'Reviewed-By' trailers, but did not give "
-                                    "a thumbs up on the MR: {}"
-                                    .format(", ".join(sorted(missing_thumbs))))
-
-            errors.append((commit, commiterrors))
-
-    import pprint
-    pprint.pprint(errors)
+        missing_thumbs = reviewers - thumbs_in_gitlab
+        if missing_thumbs:
+            key = frozenset(missing_thumbs)
+            msg = missing_msgs.get(key)
+            if msg is None:
+                msg = ("The following persons were mentioned "
+                       "in 'Reviewed-By' trailers, but did not give "
+                       "a thumbs up on the MR: {}"
+                       .format(", ".join(sorted(missing_thumbs))))
+                missing_msgs[key] = msg
+            commiterrors.append(msg)
+
+        errors.append((commit, commiterrors))
+
+    if os.environ.get("MRPROPER_DEBUG"):
+        import pprint
+        pprint.pprint(errors)
 
     must_not_be_resolved = False
     lines = []
@@ -13,14 +13,19 @@ Future Enhancement: Consider integrating this comprehensive rating system if
 execution time is acceptable for your workflow.
 """
 from .utils import print_banner
-from prettytable import PrettyTable
 from .params import RMMWeights, RMMLimits
 
+# The report schema is fixed, so format rows against static widths
+# instead of paying PrettyTable's dynamic column measuring
+_FMT = "| {:<22} | {:<20} | {:<10} | {:<8} |"
+_RULE = _FMT.format("-" * 22, "-" * 20, "-" * 10, "-" * 8)
+
+
 class CalRating:
     def __init__(self, data):
         self.data = data
         self.effective_rating = RMMWeights.TOTAL_WEIGHT.value
-        self.table = PrettyTable()
+        self.rows = []
     
     def rate_lint_disable(self, data):
         try:
@@ -28,7 +33,7 @@ class CalRating:
             if data.get("num_lint_disable") > 0:
                 self.effective_rating -= RMMWeights.LINT_DISABLE.value
                 rating = 0
-            self.table.add_row(["Lint Disables", "0", data.get("num_lint_disable"), rating])
+            self.rows.append(["Lint Disables", "0", data.get("num_lint_disable"), rating])
             return True, None
         except Exception as err:
             # print("------------")
@@ -40,7 +45,7 @@ class CalRating:
             if data.get("net_lines_of_code_change") > RMMLimits.MAX_LOC.value:
                 self.effective_rating -= RMMWeights.MAX_LOC.value
                 rating = 0
-            self.table.add_row(["Lines of Code", f"<= {RMMLimits.MAX_LOC.value}", data.get("net_lines_of_code_change"), rating])
+            self.rows.append(["Lines of Code", f"<= {RMMLimits.MAX_LOC.value}", data.get("net_lines_of_code_change"), rating])
             return True, None
         except Exception as err:
             return False, str(err)
@@ -60,7 +65,7 @@ class CalRating:
                 rating = 0
 
             # Add row in report table
-            self.table.add_row([
+            self.rows.append([
                 "Cyclomatic Complexity",
                 f"<= {RMMLimits.CYCLOMATIC_COMPLEXITY.value}",
                 avg_cc,
@@ -95,7 +100,7 @@ class CalRating:
                 rating = 0
 
             # Add row to table
-            self.table.add_row([
+            self.rows.append([
                 "Security Scan",
                 f"<= {RMMLimits.SECURITY_SCAN.value:.4f} issues/LOC",
                 f"{avg_value:.4f}",
@@ -106,24 +111,39 @@ class CalRating:
             return False, str(err)
 
     
+    # Dispatch table built once at class definition; cal_rating avoids
+    # the per-factor f-string + hasattr/getattr introspection
+    _RATERS = {
+        "lint_disable": rate_lint_disable,
+        "max_loc": rate_max_loc,
+        "cyclomatic_complexity": rate_cyclomatic_complexity,
+        "security_scan": rate_security_scan,
+    }
+
     def cal_rating(self):
         try:
             print(self.data)
             print_banner("Effective Rating Report")
-            self.table.field_names = ["Metric", "Expected", "Actual", "Rating"]
             for factor, value in self.data.items():
-                if hasattr(self, f"rate_{factor.lower()}"):
+                rater = self._RATERS.get(factor.lower())
+                if rater is not None:
                     # print("---------------")
                     # print(value)
-                    success, error = getattr(self, f"rate_{factor.lower()}")(value)
+                    success, error = rater(self, value)
                     if not success:
                         print(f"Error in rating {factor}: {error}")
                         return False, error
                 # else:
                 #     print(f"No rating method found for {factor}")
-            self.table.add_row(["------------------", "----------", "--------", "--------"])
-            self.table.add_row(["Effective rating",  RMMWeights.TOTAL_WEIGHT.value, "", max(self.effective_rating, 0)])
-            print(self.table)
+            lines = [_RULE,
+                     _FMT.format("Metric", "Expected", "Actual", "Rating"),
+                     _RULE]
+            lines.extend(_FMT.format(*row) for row in self.rows)
+            lines.append(_RULE)
+            lines.append(_FMT.format("Effective rating", RMMWeights.TOTAL_WEIGHT.value,
+                                     "", max(self.effective_rating, 0)))
+            lines.append(_RULE)
+            print("\n".join(lines))
         except Exception as err:
             # print("===============")
             # print(str(err))
@@ -5,6 +5,8 @@ Loads configuration from .rate-my-mr.yaml in the repository root.
 Provides sensible defaults when config file is not present.
 """
 
+import copy
+import functools
 import os
 import yaml
 import logging
@@ -73,6 +75,9 @@ def deep_merge(base, override):
     """
     Deep merge two dictionaries. Override values take precedence.
 
+    Only subtrees that are actually overridden get copied; untouched
+    branches are shared with the base.
+
     Args:
         base: Base configuration dict
         override: Override configuration dict
@@ -80,11 +85,14 @@ def deep_merge(base, override):
     Returns:
         dict: Merged configuration
     """
-    result = base.copy()
+    if not override:
+        return base
 
+    result = dict(base)
     for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
+        base_value = result.get(key)
+        if isinstance(base_value, dict) and isinstance(value, dict):
+            result[key] = deep_merge(base_value, value)
         else:
             result[key] = value
 
@@ -95,6 +103,9 @@ def load_config(repo_dir):
     """
     Load configuration from .rate-my-mr.yaml in the repository.
 
+    Results are memoized per (path, mtime), so repeated calls only pay
+    for the YAML parse when the file actually changes.
+
     Args:
         repo_dir: Path to the repository root
 
@@ -102,12 +113,22 @@ def load_config(repo_dir):
         dict: Configuration dictionary with defaults applied
     """
     config_path = os.path.join(repo_dir, '.rate-my-mr.yaml')
+    try:
+        mtime = os.path.getmtime(config_path)
+    except OSError:
+        mtime = 0
+
+    # Deep-copy the cached result so callers can't poison the cache
+    return copy.deepcopy(_load_config_cached(config_path, mtime))
+
 
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(config_path, mtime):
     # Start with defaults
     config = DEFAULT_CONFIG.copy()
 
     # Try to load repo-specific config
-    if os.path.exists(config_path):
+    if mtime:
         try:
             with open(config_path, 'r') as f:
                 repo_config = yaml.safe_load(f)
@@ -1,75 +1,50 @@
 import re
-import tempfile
-import os
+
 from radon.raw import analyze
 from prettytable import PrettyTable
 
+# Matches added (group 1) and removed (group 2) lines while excluding
+# the +++/--- file headers; anchored and non-backtracking, so finditer
+# makes one C-level pass over the whole buffer
+_DIFF_RE = re.compile(rb'(?m)^(?:\+(?!\+\+)(.*\n?)|-(?!--)(.*\n?))')
+
 
 class LOCCalculator:
     def __init__(self, diff_file):
         self.diff_file = diff_file
 
     def extract_modified_code(self):
-        modified_code = []
-        removed_code = []
-        with open(self.diff_file, 'r') as file:
-            for line in file:
-                # Check for the start of a code block
-                if line.startswith('+++') or line.startswith('---'):
-                    continue
-                if line.startswith('+') and not line.startswith('+++'):
-                    modified_code.append(line[1:])  # Remove the '+' sign
-                if line.startswith("-"):
-                    removed_code.append(line[1:])
-        return ''.join(modified_code), "".join(removed_code)
-
-    def get_radon_raw_metrics(self, file_path):
-        # Analyze the file and get the raw metrics
-        with open(file_path, 'r') as file:
-            code = file.read()
-
-        # Analyze the code
-        metrics = analyze(code)
-
-        return metrics
+        with open(self.diff_file, 'rb') as file:
+            data = file.read()
+        modified_code = bytearray()
+        removed_code = bytearray()
+        for m in _DIFF_RE.finditer(data):
+            added = m.group(1)
+            if added is not None:
+                modified_code += added
+            else:
+                removed_code += m.group(2)
+        return modified_code.decode('utf-8'), removed_code.decode('utf-8')
+
+    def get_radon_raw_metrics(self, code):
+        # Analyze the code string and get the raw metrics
+        return analyze(code)
 
     def calculate_loc(self):
         """
-        Calculate lines of code from diff file using temporary files with proper cleanup.
+        Calculate lines of code from diff file, analyzing the extracted
+        code in memory.
 
         Returns:
             tuple: (success: bool, data: dict or error_message: str)
         """
-        # Use NamedTemporaryFile with delete=False for thread safety and proper cleanup
-        modified_file = None
-        removed_file = None
-
         try:
             # Extract modified code from the diff output
             modified_code, removed_code = self.extract_modified_code()
 
-            # Create temporary files with proper cleanup
-            modified_file = tempfile.NamedTemporaryFile(
-                mode='w',
-                suffix='.py',
-                prefix='modified_code_',
-                delete=False
-            )
-            modified_file.write(modified_code)
-            modified_file.close()
-
-            removed_file = tempfile.NamedTemporaryFile(
-                mode='w',
-                suffix='.py',
-                prefix='removed_code_',
-                delete=False
-            )
-            removed_file.write(removed_code)
-            removed_file.close()
-
-            # Analyze the temporary files
-            added_lines = self.get_radon_raw_metrics(modified_file.name)
-            removed_lines = self.get_radon_raw_metrics(removed_file.name)
+            # Analyze the extracted code directly, no temp files needed
+            added_lines = self.get_radon_raw_metrics(modified_code)
+            removed_lines = self.get_radon_raw_metrics(removed_code)
             net_change = added_lines.sloc - removed_lines.sloc
 
             # Create a PrettyTable object
@@ -93,18 +68,6 @@ class LOCCalculator:
             }
         except Exception as err:
             return False, str(err)
-        finally:
-            # Clean up temporary files
-            if modified_file is not None:
-                try:
-                    os.unlink(modified_file.name)
-                except Exception:
-                    pass  # Ignore cleanup errors
-            if removed_file is not None:
-                try:
-                    os.unlink(removed_file.name)
-                except Exception:
-                    pass  # Ignore cleanup errors
 
 # loc_cal = LOCCalculator('diff_output2.txt')
 # success, loc_data = loc_cal.calculate_loc()
@@ -12,15 +12,61 @@ Configuration via environment variables:
 - LOG_LEVEL: Logging level (default: DEBUG)
 - LOG_MAX_BYTES: Max size per log file (default: 50MB for validators, 100MB for webhook)
 - LOG_BACKUP_COUNT: Number of backup files (default: 3 for validators, 5 for webhook)
+- LOG_ROTATION: 'internal' (default) or 'external' when logrotate manages files
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
+import functools
+from contextvars import ContextVar
 from pathlib import Path
 from datetime import datetime
 
 
+@functools.lru_cache(maxsize=256)
+def _ensure_dir(path_str):
+    """mkdir -p once per distinct directory; repeat calls skip the
+    stat/mkdir syscalls entirely."""
+    path = Path(path_str)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+# Correlation id for the current request; set by setup_logging and read
+# by _CorrelationFilter so records never touch the environment per line
+_REQUEST_ID_VAR = ContextVar('mr_request_id', default=None)
+
+
+class _CorrelationFilter(logging.Filter):
+    """Stamps the short correlation id onto each record.
+
+    Attached to the QueueHandler so it runs in the emitting thread,
+    where the context var is set — the queue listener's own thread
+    starts with a fresh context and would always read None. The
+    request id rarely changes within a process, so the derived short
+    form is cached until it does.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._last_request_id = None
+        self._last_short_id = 'unknown'
+
+    def filter(self, record):
+        request_id = _REQUEST_ID_VAR.get()
+        if request_id is None:
+            request_id = os.environ.get('REQUEST_ID', 'unknown')
+        if request_id != self._last_request_id:
+            self._last_request_id = request_id
+            self._last_short_id = (request_id.split('_')[-1][:8]
+                                   if request_id != 'unknown'
+                                   else 'unknown')
+        record.correlation_id = self._last_short_id
+        return True
+
+
 class AlignedPipeFormatter(logging.Formatter):
     """
     Custom formatter with pipe-separated, column-aligned output.
@@ -53,18 +99,45 @@ class AlignedPipeFormatter(logging.Formatter):
     def __init__(self):
         # Format with milliseconds
         super().__init__(
-            fmt='%(asctime)s.%(msecs)03d | %(levelname)-8s | %(module_name)-15s | %(correlation_id)-8s | %(message)s',
+            fmt='%(asctime)s.%(msecs)03d | %(levelname)-8s | %(module_name)s | %(correlation_id)-8s | %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
+        # REQUEST_ID is set once by setup_logging before the formatter
+        # is built; cache the derived short id instead of re-reading the
+        # environment on every log line
+        self.refresh_correlation_id()
+        # Shortened-and-padded module names per logger name; a handful
+        # of loggers exist, so format() is one dict hit per record
+        self._name_cache = {}
+
+    def refresh_correlation_id(self):
+        """Re-read REQUEST_ID from the environment (call if it rotates)."""
+        request_id = os.environ.get('REQUEST_ID', 'unknown')
+        self._correlation_id = (request_id.split('_')[-1][:8]
+                                if request_id != 'unknown' else 'unknown')
 
     def format(self, record):
-        # Add correlation ID (REQUEST_ID_SHORT)
-        request_id = os.environ.get('REQUEST_ID', 'unknown')
-        record.correlation_id = request_id.split('_')[-1][:8] if request_id != 'unknown' else 'unknown'
+        # The correlation ID (REQUEST_ID_SHORT) is stamped on the record
+        # by _CorrelationFilter in the emitting thread — this runs on
+        # the queue listener's thread, where the context var is unset.
+        # Records from handlers without the filter get the env-derived
+        # value cached at formatter init.
+        if not hasattr(record, 'correlation_id'):
+            record.correlation_id = self._correlation_id
+
+        # Shorten/pad the module name once per logger name; subsequent
+        # records from the same logger are a single dict lookup
+        module_name = self._name_cache.get(record.name)
+        if module_name is None:
+            module_name = self._shorten_name(record.name)
+            self._name_cache[record.name] = module_name
+        record.module_name = module_name
 
-        # Get module name from logger name (more reliable than module attribute)
-        module_name = record.name
+        # Format the record
+        return super().format(record)
 
+    def _shorten_name(self, module_name):
+        """Map a logger name to its short, width-padded display form."""
         # Map long module names to short readable names using direct prefix matching
         # This is more robust than exact matching
         if module_name.startswith('mrproper.rate_my_mr.rate_my_mr'):
@@ -83,25 +156,42 @@ class AlignedPipeFormatter(logging.Formatter):
             module_name = 'config-loader'
         elif module_name.startswith('mrproper.rate_my_mr.logging_config'):
             module_name = 'logging'
-        elif module_name.startswith('validator.'):
-            # Main validator logger: validator.20251117_101804_715563 -> main
+        elif module_name.startswith(('validator.', 'rate_my_mr.validator')):
+            # Main validator logger -> main
             module_name = 'main'
-        elif module_name.startswith('webhook.'):
+        elif module_name.startswith(('webhook.', 'rate_my_mr.webhook')):
             module_name = 'webhook'
-        elif module_name.startswith('gitlab-api.'):
+        elif module_name.startswith(('gitlab-api.', 'rate_my_mr.gitlab-api')):
             module_name = 'gitlab-api'
 
         # Truncate or pad module name to fit width
         if len(module_name) > self.MODULE_WIDTH:
-            record.module_name = module_name[:self.MODULE_WIDTH - 3] + '...'
-        else:
-            record.module_name = module_name
+            return module_name[:self.MODULE_WIDTH - 3] + '...'
+        return module_name.ljust(self.MODULE_WIDTH)
 
-        # Add milliseconds
-        record.msecs = record.msecs
 
-        # Format the record
-        return super().format(record)
+class _LazyFields:
+    """Defers k=v formatting of log kwargs until record emission.
+
+    Call sites log fixed key sets, so the 'a={a} b={b}' template for
+    each set is built once and rendered with a single format_map pass
+    instead of a per-field f-string.
+    """
+    __slots__ = ('kwargs',)
+
+    _templates = {}
+
+    def __init__(self, kwargs):
+        self.kwargs = kwargs
+
+    def __str__(self):
+        kwargs = self.kwargs
+        keys = tuple(kwargs)
+        template = self._templates.get(keys)
+        if template is None:
+            template = ' '.join(k + '={' + k + '}' for k in keys)
+            self._templates[keys] = template
+        return template.format_map(kwargs)
 
 
 class StructuredLogger:
@@ -119,28 +209,35 @@ class StructuredLogger:
     def __init__(self, logger):
         self.logger = logger
 
-    def _format_message(self, message, **kwargs):
-        """Format message with structured fields."""
-        if kwargs:
-            # Convert kwargs to key=value pairs
-            fields = ' '.join(f'{k}={v}' for k, v in kwargs.items())
-            return f'{message} | {fields}'
-        return message
-
     def debug(self, message, **kwargs):
-        self.logger.debug(self._format_message(message, **kwargs))
+        if kwargs:
+            self.logger.debug('%s | %s', message, _LazyFields(kwargs))
+        else:
+            self.logger.debug('%s', message)
 
     def info(self, message, **kwargs):
-        self.logger.info(self._format_message(message, **kwargs))
+        if kwargs:
+            self.logger.info('%s | %s', message, _LazyFields(kwargs))
+        else:
+            self.logger.info('%s', message)
 
     def warning(self, message, **kwargs):
-        self.logger.warning(self._format_message(message, **kwargs))
+        if kwargs:
+            self.logger.warning('%s | %s', message, _LazyFields(kwargs))
+        else:
+            self.logger.warning('%s', message)
 
     def error(self, message, **kwargs):
-        self.logger.error(self._format_message(message, **kwargs))
+        if kwargs:
+            self.logger.error('%s | %s', message, _LazyFields(kwargs))
+        else:
+            self.logger.error('%s', message)
 
     def critical(self, message, **kwargs):
-        self.logger.critical(self._format_message(message, **kwargs))
+        if kwargs:
+            self.logger.critical('%s | %s', message, _LazyFields(kwargs))
+        else:
+            self.logger.critical('%s', message)
 
 
 class LogConfig:
@@ -155,12 +252,25 @@ class LogConfig:
     - LOG_STRUCTURE: 'flat' or 'organized' (default: organized)
     """
 
+    # Parsed once at class definition: the environment is fixed for the
+    # life of the process, so per-instance re-reads and int() coercions
+    # are avoided
+    _BASE_DIR = os.environ.get('LOG_DIR', '/home/docker/tmp/mr-validator-logs')
+    _LEVEL = os.environ.get('LOG_LEVEL', 'DEBUG')
+    _MAX_BYTES = int(os.environ.get('LOG_MAX_BYTES', 50 * 1024 * 1024))  # 50MB
+    _BACKUP_COUNT = int(os.environ.get('LOG_BACKUP_COUNT', 3))
+    _STRUCTURE = os.environ.get('LOG_STRUCTURE', 'organized')
+    # 'internal' rotates in-process; 'external' defers to logrotate
+    # and skips the per-record size check
+    _ROTATION = os.environ.get('LOG_ROTATION', 'internal')
+
     def __init__(self):
-        self.base_dir = os.environ.get('LOG_DIR', '/home/docker/tmp/mr-validator-logs')
-        self.level = os.environ.get('LOG_LEVEL', 'DEBUG')
-        self.max_bytes = int(os.environ.get('LOG_MAX_BYTES', 50 * 1024 * 1024))  # 50MB
-        self.backup_count = int(os.environ.get('LOG_BACKUP_COUNT', 3))
-        self.structure = os.environ.get('LOG_STRUCTURE', 'organized')
+        self.base_dir = self._BASE_DIR
+        self.level = self._LEVEL
+        self.max_bytes = self._MAX_BYTES
+        self.backup_count = self._BACKUP_COUNT
+        self.structure = self._STRUCTURE
+        self.rotation = self._ROTATION
 
     def get_log_path(self, log_type, request_id=None, project=None, mr_iid=None):
         """
@@ -193,8 +303,7 @@ class LogConfig:
             # Organized structure by project (no date folder)
             if log_type == 'webhook':
                 # Webhook logs go to webhook directory
-                log_dir = base / 'webhook'
-                log_dir.mkdir(parents=True, exist_ok=True)
+                log_dir = _ensure_dir(str(base / 'webhook'))
                 return log_dir / 'webhook-server.log'
 
             elif log_type == 'validator' or log_type == 'gitlab-api':
@@ -202,8 +311,8 @@ class LogConfig:
                 if project and mr_iid:
                     # Sanitize project name for filesystem
                     safe_project = project.replace('/', '_').replace('%2F', '_')
-                    log_dir = base / 'validations' / safe_project / f'mr-{mr_iid}'
-                    log_dir.mkdir(parents=True, exist_ok=True)
+                    log_dir = _ensure_dir(str(
+                        base / 'validations' / safe_project / f'mr-{mr_iid}'))
 
                     request_id_short = request_id.split('_')[-1][:8] if request_id else 'unknown'
 
@@ -218,6 +327,23 @@ class LogConfig:
         return base / 'unknown.log'
 
 
+# Log file each log type is currently configured for; lets repeat
+# setup_logging calls with the same target skip handler rebuilds
+_configured_paths = {}
+
+# Live queue listeners, drained once at interpreter exit so buffered
+# records are flushed before the process dies
+_queue_listeners = set()
+
+
+def _stop_queue_listeners():
+    while _queue_listeners:
+        _queue_listeners.pop().stop()
+
+
+atexit.register(_stop_queue_listeners)
+
+
 def setup_logging(log_type='validator', request_id='unknown', project=None, mr_iid=None):
     """
     Setup logging with aligned pipe format and configurable directory.
@@ -237,22 +363,40 @@ def setup_logging(log_type='validator', request_id='unknown', project=None, mr_i
     # Get log file path
     log_file_path = config.get_log_path(log_type, request_id, project, mr_iid)
 
-    # Ensure log directory exists
-    log_file_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Set REQUEST_ID in environment for formatter
+    # Set REQUEST_ID in environment (other modules read it) and in the
+    # context var _CorrelationFilter stamps records from
     os.environ['REQUEST_ID'] = request_id
+    _REQUEST_ID_VAR.set(request_id)
+
+    # One fixed logger per log type: correlation comes from the context
+    # var, so the logging manager's logger table stays bounded in a
+    # long-lived process
+    logger = logging.getLogger(f'rate_my_mr.{log_type}')
+
+    # If this log type already writes to the requested file, only the
+    # correlation id changed — skip rebuilding handlers and listener
+    if _configured_paths.get(log_type) == str(log_file_path):
+        return logger, StructuredLogger(logger)
+
+    # Ensure log directory exists
+    _ensure_dir(str(log_file_path.parent))
 
     # Create formatter
     formatter = AlignedPipeFormatter()
 
-    # File handler with rotation
-    file_handler = logging.handlers.RotatingFileHandler(
-        str(log_file_path),
-        maxBytes=config.max_bytes,
-        backupCount=config.backup_count,
-        encoding='utf-8'
-    )
+    # File handler with rotation. With LOG_ROTATION=external (e.g.
+    # logrotate owns the files) a WatchedFileHandler is used instead: it
+    # only reopens on inode change, with no per-record rollover check
+    if config.rotation == 'external':
+        file_handler = logging.handlers.WatchedFileHandler(
+            str(log_file_path), encoding='utf-8')
+    else:
+        file_handler = logging.handlers.RotatingFileHandler(
+            str(log_file_path),
+            maxBytes=config.max_bytes,
+            backupCount=config.backup_count,
+            encoding='utf-8'
+        )
     file_handler.setLevel(getattr(logging, config.level))
     file_handler.setFormatter(formatter)
 
@@ -261,16 +405,34 @@ def setup_logging(log_type='validator', request_id='unknown', project=None, mr_i
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
 
-    # Create logger
-    logger = logging.getLogger(f'{log_type}.{request_id}')
     logger.setLevel(getattr(logging, config.level))
     logger.handlers = []  # Clear existing handlers
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+
+    # Log calls only enqueue the record; a listener thread does the
+    # formatting, file write and rotation, so hot paths never block on
+    # synchronous log I/O
+    listener = getattr(logger, '_mr_queue_listener', None)
+    if listener is not None:
+        _queue_listeners.discard(listener)
+        listener.stop()
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler,
+        respect_handler_level=True)
+    listener.start()
+    _queue_listeners.add(listener)
+    logger._mr_queue_listener = listener
+    # The correlation filter must sit on the queue handler: it has to
+    # run before the record crosses the queue to the listener thread
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(_CorrelationFilter())
+    logger.addHandler(queue_handler)
 
     # Prevent propagation to root logger
     logger.propagate = False
 
+    _configured_paths[log_type] = str(log_file_path)
+
     # Create structured logger
     slog = StructuredLogger(logger)
 
@@ -43,7 +43,10 @@ class RMMGenericView(Enum):
     MR_SUMMARY = "MR_SUMMARY"
     INITIAL_REVIEW = "INITIAL_REVIEW"
 
+# The applicable checks never change at runtime; build the tuple once
+_ALL_APPLICABLE_CHECKS = (RMMGenericView.MR_SUMMARY.value, RMMGenericView.INITIAL_REVIEW.value,
+                          RMMChecks.MAX_LOC.value, RMMChecks.LINT_DISABLE.value,
+                          RMMChecks.CYCLOMATIC_COMPLEXITY.value, RMMChecks.SECURITY_SCAN.value)
+
 def get_all_applicable_checks():
-    generic_views = [RMMGenericView.MR_SUMMARY.value, RMMGenericView.INITIAL_REVIEW.value]
-    checks = [RMMChecks.MAX_LOC.value, RMMChecks.LINT_DISABLE.value, RMMChecks.CYCLOMATIC_COMPLEXITY.value, RMMChecks.SECURITY_SCAN.value]
-    return generic_views + checks
+    return _ALL_APPLICABLE_CHECKS
@@ -1,4 +1,5 @@
 import requests
+from requests.adapters import HTTPAdapter, Retry
 import argparse
 from prettytable import PrettyTable
 import re
@@ -6,6 +7,7 @@ import json
 import os
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from .loc import LOCCalculator
 from .params import RMMConstants, RMMWeights, RMMLimits, get_all_applicable_checks
 from .cyclomatic_complexity import CyclomaticComplexityCalculator
@@ -22,6 +24,19 @@ except ImportError:
 # Get logger (will use the logger set up by rate_my_mr_gitlab.py)
 logger = logging.getLogger(__name__)
 
+# Persistent session so the 3+ AI calls per MR reuse one TCP+TLS
+# connection instead of handshaking on every request
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                       max_retries=Retry(total=2, backoff_factor=0.2))
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
+# Scan candidate '{' positions and let the JSON decoder do the real
+# parsing; handles nested braces and never backtracks
+_JSON_START_RE = re.compile(r'\{')
+_DECODER = json.JSONDecoder()
+
 # Helper for structured logging
 class StructuredLog:
     """Lightweight structured logging helper that uses module logger."""
@@ -117,13 +132,20 @@ def send_request(payload, url=RMMConstants.agent_url.value, max_retries=3):
                 time.sleep(wait_time)
 
             slog.debug("Sending POST request to AI service", attempt=f"{attempt + 1}/{max_retries}")
-            resp = requests.post(url, json=payload, timeout=120)
-            slog.debug("AI Service response", status_code=resp.status_code, content_length=len(resp.content))
+            resp = _SESSION.post(url, json=payload, timeout=120, stream=True)
+            slog.debug("AI Service response", status_code=resp.status_code)
 
             # Raise an error for bad responses (4xx and 5xx)
             resp.raise_for_status()
 
-            response_json = resp.json()
+            # Stream the body into one buffer instead of letting requests
+            # materialize .content and .text next to the parsed dict
+            buf = bytearray()
+            for chunk in resp.iter_content(65536):
+                buf.extend(chunk)
+            slog.debug("AI Service response received", content_length=len(buf))
+
+            response_json = json.loads(buf)
             slog.debug("AI Service JSON parsed successfully")
             return resp.status_code, response_json
 
@@ -174,7 +196,7 @@ def send_request(payload, url=RMMConstants.agent_url.value, max_retries=3):
     return None, f"Failed after {max_retries} attempts"
 
 
-def generate_summary(file_path):
+def generate_summary(diff_output):
     # parser = argparse.ArgumentParser(
     #     description="Test Claude microservice with messages and optional thinking"
     # )
@@ -182,9 +204,6 @@ def generate_summary(file_path):
     # args, _ = parser.parse_known_args()
     # url = args.url if hasattr(args, 'url') else "http://10.31.88.29:6006/generate"
 
-    # Read the git diff output from a file
-    with open(file_path, 'r') as file:
-        diff_output = file.read()
     payload1 = {
         "messages": [
             {"role": "system", "content": "You are a summarizer. Provide a concise summary of the git diff output."},
@@ -209,9 +228,7 @@ def generate_summary(file_path):
             print(f"Failed to parse AI response: {e}")
             return False, str(e)
 
-def generate_initial_code_review(file_path):
-    with open(file_path, 'r') as file:
-        diff_output = file.read()
+def generate_initial_code_review(diff_output):
     payload1 = {
         "messages": [
             {"role": "system", "content": ("You are a code reviewer tasked with evaluating the following code. Please analyze it thoroughly and provide detailed feedback, focusing on the following aspects:"
@@ -242,10 +259,8 @@ def generate_initial_code_review(file_path):
             print(f"Failed to parse AI response: {e}")
             return False, str(e)
 
-def generate_lint_disable_report(file_path):
+def generate_lint_disable_report(diff_output):
     try:
-        with open(file_path, 'r') as file:
-            diff_output = file.read()
         payload1 = {
             "messages": [
                 {"role": "system", "content": ("Please analyze the following git diff output and extract all instances of # pylint: disable= comments. For each instance, provide a summary that includes:"
@@ -267,15 +282,15 @@ def generate_lint_disable_report(file_path):
             content = lint_disbale.get('content')[0]
             content_type = content.get('type')
             content_body = content.get(content_type)
-            pattern = r'\{[^{}]*"num_lint_disable":\s*(\d+),\s*"lints_that_disabled":\s*"([^"]*)"[^{}]*\}'
             print(content_body)
-            match = re.search(pattern, content_body)
-            json_data = {}
-            # Check if a match was found and print the result
-            if match:
-                json_data = match.group(0)
-                json_data = json.loads(json_data)
-                return True, json_data
+            # Try to parse JSON at each '{' until the report object is found
+            for m in _JSON_START_RE.finditer(content_body):
+                try:
+                    json_data, _ = _DECODER.raw_decode(content_body, m.start())
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(json_data, dict) and "num_lint_disable" in json_data:
+                    return True, json_data
             return False, "No data is available"
     except Exception as err:
         return False, str(err)
@@ -433,17 +448,34 @@ def main():
         "SECURITY_SCAN": cal_ss
     }
 
+    # The AI-backed checks are independent HTTP calls against the same
+    # service, so run them concurrently; they share the pooled session,
+    # and the wall time becomes the slowest call instead of the sum
+    ai_checks = ("MR_SUMMARY", "INITIAL_REVIEW", "LINT_DISABLE")
+
+    # Read the diff once and hand the string to the AI checks instead of
+    # each of them re-reading the same file
+    with open(args.filename, 'r') as f:
+        diff_output = f.read()
+
     collected_data = {}
 
-    for check, func in checks_func_map.items():
-        # print(check)
-        if check in all_checks:
-            success, result = func(args.filename)
-            # print(success)
-            # print(result)
-            if not success:
-                print(f"Failed to execute {check}: {result}")
-            collected_data[check] = result
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = {check: executor.submit(checks_func_map[check], diff_output)
+                   for check in ai_checks if check in all_checks}
+
+        for check, func in checks_func_map.items():
+            # print(check)
+            if check in all_checks:
+                if check in futures:
+                    success, result = futures[check].result()
+                else:
+                    success, result = func(args.filename)
+                # print(success)
+                # print(result)
+                if not success:
+                    print(f"Failed to execute {check}: {result}")
+                collected_data[check] = result
     # print("@"*100)
     # print(collected_data)
     cal_rating_obj = CalRating(collected_data)
@@ -534,7 +534,9 @@ Please check the MR manually and retry if necessary.
             gitlab.update_discussion(proj, mriid, HEADER, error_report, False)
             return
 
-        # Verify diff file content
+        # Read the diff once; the AI generators take the string so the
+        # file is not re-read per check
+        diff_content = ""
         try:
             with open(diff_file_path, 'r') as f:
                 diff_content = f.read()
@@ -549,7 +551,7 @@ Please check the MR manually and retry if necessary.
         # 1. Generate AI summary (if enabled)
         slog.debug("Step 1: Generating AI summary")
         if is_feature_enabled(config, 'ai_summary'):
-            summary_success, summary_content = generate_summary(diff_file_path)
+            summary_success, summary_content = generate_summary(diff_content)
             if summary_success:
                 slog.info("AI summary succeeded")
             else:
@@ -563,7 +565,7 @@ Please check the MR manually and retry if necessary.
         # 2. Generate AI code review (if enabled)
         slog.debug("Step 2: Generating AI code review")
         if is_feature_enabled(config, 'ai_code_review'):
-            review_success, review_content = generate_initial_code_review(diff_file_path)
+            review_success, review_content = generate_initial_code_review(diff_content)
             if review_success:
                 slog.info("AI code review succeeded")
             else:
@@ -599,7 +601,7 @@ Please check the MR manually and retry if necessary.
         slog.debug("Step 4: Analyzing lint disables")
         if is_feature_enabled(config, 'lint_disable_check'):
             lint_settings = get_lint_settings(config)
-            lint_success, lint_data = generate_lint_disable_report(diff_file_path)
+            lint_success, lint_data = generate_lint_disable_report(diff_content)
 
             if not lint_success:
                 slog.warning("Lint analysis failed", error=lint_data)
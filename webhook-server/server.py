@@ -166,12 +166,13 @@ app = tornado.web.Application(routes, **settings)
 
 
 def main():
-    # Ensure log directory exists
-    os.makedirs('/home/docker/tmp/mr-validator-logs', exist_ok=True)
+    # Ensure log directory exists (honours LOG_DIR like the validators do)
+    log_dir = os.environ.get('LOG_DIR', '/home/docker/tmp/mr-validator-logs')
+    os.makedirs(log_dir, exist_ok=True)
 
     # Setup logging with rotation (100 MB per file, keep 5 backups)
     file_handler = logging.handlers.RotatingFileHandler(
-        '/home/docker/tmp/mr-validator-logs/webhook-server.log',
+        os.path.join(log_dir, 'webhook-server.log'),
         maxBytes=100 * 1024 * 1024,  # 100 MB
         backupCount=5,
         encoding='utf-8'